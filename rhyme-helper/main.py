@@ -1,5 +1,85 @@
+import cmd
+import collections
+import functools
+import pickle
+import string
+from pathlib import Path
+
+import cmudict
 import pronouncing
 
+# On-disk cache of the rhyme index, keyed by the CMUdict version it was built from.
+INDEX_CACHE_PATH = Path(__file__).with_name(f".rhyme_index_cmudict_{cmudict.__version__}.pkl")
+
+def _build_rhyme_index():
+    """
+    Build the rhyme index from the CMU pronouncing dictionary in a single pass.
+    
+    Returns:
+        tuple[dict, dict]: A mapping of word -> list of its phones, and a mapping of
+        rhyming part -> list of words sharing it.
+    """
+    pronouncing.init_cmu()
+    phones_index = collections.defaultdict(list)
+    rhyme_index = collections.defaultdict(list)
+    for word, phones in pronouncing.pronunciations:
+        phones_index[word].append(phones)
+        key = pronouncing.rhyming_part(phones)
+        if key is not None:
+            rhyme_index[key].append(word)
+    return dict(phones_index), dict(rhyme_index)
+
+def _load_rhyme_index():
+    """
+    Load the rhyme index from the on-disk cache, building and saving it if needed.
+    
+    Returns:
+        tuple[dict, dict]: See `_build_rhyme_index`.
+    """
+    try:
+        with INDEX_CACHE_PATH.open("rb") as f:
+            phones_index, rhyme_index = pickle.load(f)
+        if isinstance(phones_index, dict) and isinstance(rhyme_index, dict):
+            return phones_index, rhyme_index
+    except Exception:
+        # A missing, stale or foreign cache file is not fatal: rebuild it below.
+        pass
+    
+    index = _build_rhyme_index()
+    try:
+        with INDEX_CACHE_PATH.open("wb") as f:
+            pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        # The cache is only an optimization; carry on without it.
+        pass
+    return index
+
+PHONES_INDEX, RHYME_INDEX = _load_rhyme_index()
+
+# Translation table removing punctuation, built once and reused for every query
+# to check that the input is made of letters.
+_PUNCTUATION_TABLE = str.maketrans("", "", string.punctuation)
+
+@functools.lru_cache(maxsize=4096)
+def _rhymes(word):
+    """
+    Look up the rhymes for a word, caching the result for repeated queries.
+    
+    Matches `pronouncing.rhymes`, but uses the precomputed index instead of
+    reloading the pronouncing dictionary.
+    
+    Parameters:
+        word (str): The word to find rhymes for.
+    
+    Returns:
+        tuple[str, ...]: The rhyming words, as an immutable tuple so cached results cannot be modified.
+    """
+    rhymes = set()
+    for phones in PHONES_INDEX.get(word, []):
+        rhymes.update(RHYME_INDEX.get(pronouncing.rhyming_part(phones), []))
+    rhymes.discard(word)
+    return tuple(sorted(rhymes))
+
 def generate_rhyming_scheme(word, num_rhymes=10):
     """
     Generate a rhyming scheme based on a given word.
@@ -9,9 +89,21 @@ def generate_rhyming_scheme(word, num_rhymes=10):
         num_rhymes (int): The number of rhyming words to include in the scheme.
     
     Returns:
-        str: A rhyming scheme based on the input word.
+        str: A rhyming scheme based on the input word, or an "Invalid word" message if
+        the input contains no letters or characters other than letters and punctuation.
     """
-    rhymes = pronouncing.rhymes(word)
+    # Normalize the input and reject anything that cannot be a word before looking it up.
+    # Apostrophes, hyphens and periods appear in dictionary words (e.g. "don't"), so
+    # punctuation is ignored when checking that the word is made of letters.
+    query = word.casefold().strip()
+    if not query.translate(_PUNCTUATION_TABLE).isalpha():
+        return f"Invalid word: '{query}'."
+    
+    # Strip surrounding punctuation (e.g. "cat!" or "cat,"), unless the input is itself a
+    # dictionary entry such as "'bout" or "a.".
+    word = query if query in PHONES_INDEX else query.strip(string.punctuation)
+    
+    rhymes = _rhymes(word)
     if not rhymes:
         return f"No rhymes found for the word '{word}'."
     
@@ -19,42 +111,74 @@ def generate_rhyming_scheme(word, num_rhymes=10):
     rhymes = rhymes[:num_rhymes]
     
     # Create a rhyming scheme
-    scheme = ""
-    for i, rhyme in enumerate(rhymes, start=1):
-        scheme += f"{i}: {rhyme}\n"
-    
-    return scheme
+    return "".join(f"{i}: {rhyme}\n" for i, rhyme in enumerate(rhymes, start=1))
 
-# Main program loop
-if __name__ == "__main__":
-    print("Rhyming Scheme Generator")
-    print("Type 'exit' or 'quit' to stop the program.")
-    print("Type 'set num_rhymes [number]' to adjust the number of rhymes displayed.\n")
+class RhymeShell(cmd.Cmd):
+    """
+    Interactive shell for the rhyming scheme generator.
+    
+    Only 'exit', 'quit' and 'set num_rhymes [number]' are commands, dispatched to the
+    matching `do_*` method; anything else (including "help" or "?", which cmd.Cmd
+    would otherwise handle itself) is treated as a word to find rhymes for.
+    """
     
+    intro = (
+        "Rhyming Scheme Generator\n"
+        "Type 'exit' or 'quit' to stop the program.\n"
+        "Type 'set num_rhymes [number]' to adjust the number of rhymes displayed.\n"
+    )
+    prompt = "Enter a word or command: "
     num_rhymes = 10  # Default number of rhymes
     
-    while True:
-        user_input = input("Enter a word or command: ").strip().lower()
-        
-        # Handle exit command
-        if user_input in {"exit", "quit"}:
-            print("Goodbye!")
-            break
-        
-        # Handle setting num_rhymes
-        if user_input.startswith("set num_rhymes"):
-            try:
-                _, _, new_value = user_input.split()
-                num_rhymes = int(new_value)
-                if num_rhymes < 1:
-                    print("Please enter a positive number for num_rhymes.\n")
-                else:
-                    print(f"Number of rhymes set to {num_rhymes}.\n")
-            except (ValueError, IndexError):
-                print("Invalid command. Usage: set num_rhymes [number]\n")
-            continue
+    def precmd(self, line):
+        # Commands and words are case-insensitive; "EOF" is what cmd passes on end of input.
+        return line if line == "EOF" else line.strip().lower()
+    
+    def onecmd(self, line):
+        if not line:
+            return self.emptyline()
+        if line in {"exit", "quit", "EOF"} or line.split()[:2] == ["set", "num_rhymes"]:
+            return super().onecmd(line)
+        return self.default(line)
+    
+    def emptyline(self):
+        # Do nothing instead of repeating the last command.
+        pass
+    
+    def do_exit(self, arg):
+        """Stop the program."""
+        print("Goodbye!")
+        return True
+    
+    do_quit = do_exit
+    
+    def do_EOF(self, arg):
+        print()
+        return self.do_exit(arg)
+    
+    def do_set(self, arg):
+        """Adjust a setting. Usage: set num_rhymes [number]"""
+        try:
+            name, new_value = arg.split()
+            if name != "num_rhymes":
+                raise ValueError(name)
+            num_rhymes = int(new_value)
+        except ValueError:
+            print("Invalid command. Usage: set num_rhymes [number]\n")
+            return
         
+        if num_rhymes < 1:
+            print("Please enter a positive number for num_rhymes.\n")
+        else:
+            self.num_rhymes = num_rhymes
+            print(f"Number of rhymes set to {num_rhymes}.\n")
+    
+    def default(self, line):
         # Generate and display rhyming scheme
         print("\nRhyming Scheme:")
-        print(generate_rhyming_scheme(user_input, num_rhymes))
+        print(generate_rhyming_scheme(line, self.num_rhymes))
         print()
+
+# Main program loop
+if __name__ == "__main__":
+    RhymeShell().cmdloop()